@@ -1,16 +1,102 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import tkinter.font as tkfont
+import errno
+import functools
 import json
+import queue
+import selectors
 import socket
+import struct
 import threading
 import time
+import traceback
+
+try:
+    import orjson  # Optional C JSON codec, used when installed
+except ImportError:
+    orjson = None
+
+# UI theme colors
+BG_DARK = "#2E2E2E"
+BG_FIELD = "#424242"
+FG_TEXT = "#FFFFFF"
+ACCENT = "#2196F3"
+ACCENT_ACTIVE = "#1976D2"
+COLOR_OK = "#4CAF50"       # Green
+COLOR_ERROR = "#F44336"    # Red
+COLOR_PENDING = "#FF9800"  # Orange
+TOOLTIP_BG = "#FFFFDD"
+
+# Status panel (text, color) for each probed node state
+NODE_STATE_DISPLAY = {
+    "up": ("Connected", COLOR_OK),
+    "down": ("Disconnected", COLOR_ERROR),
+}
+
+# Wire frame header: 1-byte status, then 4-byte big-endian payload length
+FRAME_HEADER = struct.Struct(">BI")
+STATUS_OK = 0
+STATUS_ERROR = 1
+MAX_FRAME_SIZE = 64 << 20  # Matches the nodes' maxFrameSize; bounds a corrupt header
+
+# Fields shown per operation, in order: (field, default value, tooltip text)
+FIELD_SPECS = {
+    "CREATE_DB": [
+        ("db", "mydb", "Name of the database to create, e.g., 'mydb'"),
+    ],
+    "DROP_DB": [
+        ("db", "mydb", "Name of the database to drop, e.g., 'mydb'"),
+    ],
+    "CREATE_TABLE": [
+        ("db", "mydb", "Name of the database, e.g., 'mydb'"),
+        ("table", "users", "Name of the table to create, e.g., 'users'"),
+        ("data", '{"id": "int", "name": "string"}', 'Column definitions as JSON, e.g., {"id": "int", "name": "string"}'),
+    ],
+    "INSERT": [
+        ("db", "mydb", "Name of the database, e.g., 'mydb'"),
+        ("table", "users", "Name of the table, e.g., 'users'"),
+        ("data", '{"id": 1, "name": "Alice"}', 'Row data as JSON, e.g., {"id": 1, "name": "Alice"}'),
+    ],
+    "UPDATE": [
+        ("db", "mydb", "Name of the database, e.g., 'mydb'"),
+        ("table", "users", "Name of the table, e.g., 'users'"),
+        ("data", '{"name": "Alicia"}', 'Values to update as JSON, e.g., {"name": "Alicia"}'),
+        ("cond", '{"id": 1}', 'Condition to select rows, e.g., {"id": 1}'),
+    ],
+    "DELETE": [
+        ("db", "mydb", "Name of the database, e.g., 'mydb'"),
+        ("table", "users", "Name of the table, e.g., 'users'"),
+        ("cond", '{"id": 1}', 'Condition to select rows to delete, e.g., {"id": 1}'),
+    ],
+    "SEARCH": [
+        ("db", "mydb", "Name of the database, e.g., 'mydb'"),
+        ("table", "users", "Name of the table, e.g., 'users'"),
+        ("cond", '{"id": 1}', 'Filter rows, e.g., {"id": 1} for specific ID, or {} for all rows'),
+    ],
+}
+
+# Most lines shown in the result box; longer replies are cut with a note
+RESULT_MAX_LINES = 2000
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Parsed Data/Condition inputs, keyed by the exact entry text. Repeated executes
+# with the same JSON skip the parser; 128 short strings is a negligible footprint.
+# Results are the shared cache entries themselves and must be treated as read-only:
+# callers only serialize them, so no copy is made on the hot path.
+@functools.lru_cache(maxsize=128)
+def _parse_json(text):
+    return _json_loads(text)
 
 # ToolTip provides hover-over help text for GUI widgets
 class ToolTip:
-    def __init__(self, widget, text):
+    def __init__(self, widget, text, font=("Arial", 10)):
         self.widget = widget
-        self.text = text
-        self.tooltip = None
+        self.text = text  # Read on every show, so callers may reassign it
+        self.font = font
+        self._tip = None  # Hidden Toplevel, created on first hover and reused
+        self._label = None
         self.widget.bind("<Enter>", self.show_tooltip)
         self.widget.bind("<Leave>", self.hide_tooltip)
 
@@ -18,17 +104,19 @@ class ToolTip:
         # Display tooltip at widget's position
         x = self.widget.winfo_rootx() + 20
         y = self.widget.winfo_rooty() + 20
-        self.tooltip = tk.Toplevel(self.widget)
-        self.tooltip.wm_overrideredirect(True)
-        self.tooltip.wm_geometry(f"+{x}+{y}")
-        label = tk.Label(self.tooltip, text=self.text, background="#FFFFDD", relief="solid", borderwidth=1, font=("Arial", 10))
-        label.pack()
+        if self._tip is None:
+            self._tip = tk.Toplevel(self.widget)
+            self._tip.wm_overrideredirect(True)
+            self._label = tk.Label(self._tip, background=TOOLTIP_BG, relief="solid", borderwidth=1, font=self.font)
+            self._label.pack()
+        self._label.config(text=self.text)
+        self._tip.wm_geometry(f"+{x}+{y}")
+        self._tip.deiconify()
 
     def hide_tooltip(self, event=None):
-        # Remove tooltip
-        if self.tooltip:
-            self.tooltip.destroy()
-            self.tooltip = None
+        # Hide tooltip, keeping the window for the next hover
+        if self._tip is not None:
+            self._tip.withdraw()
 
 # DatabaseGUI manages the Tkinter interface
 class DatabaseGUI:
@@ -36,228 +124,307 @@ class DatabaseGUI:
         self.root = root
         self.root.title("Distributed Database System")
         self.root.geometry("900x700")
-        self.root.configure(bg="#2E2E2E")
+        self.root.configure(bg=BG_DARK)
+
+        # Shared fonts, resolved once and reused by every widget
+        self._fonts = {
+            "header": tkfont.Font(family="Arial", size=16, weight="bold"),
+            "label": tkfont.Font(family="Arial", size=11),
+            "btn": tkfont.Font(family="Arial", size=10, weight="bold"),
+            "small": tkfont.Font(family="Arial", size=10),
+        }
+
+        # Set on window close; stops the status checker and operation worker
+        self._stop = threading.Event()
 
         # GUI state variables
         self.node_type = tk.StringVar(value="Master")
-        self.node_ip_port = tk.StringVar(value="192.168.149.137:8000")
+        self.node_ip_port = tk.StringVar()
         self.operation = tk.StringVar(value="CREATE_DB")
         self.database = tk.StringVar()
         self.table = tk.StringVar()
         self.data = tk.StringVar()
         self.condition = tk.StringVar()
 
-        # Node configurations
+        # Node configurations as (host, port), parsed once up front
         self.node_configs = {
-            "Master": "192.168.149.137:8000",
-            "Slave 1": "192.168.149.137:8001",
-            "Slave 2": "192.168.149.137:8002"
+            "Master": ("192.168.149.137", 8000),
+            "Slave 1": ("192.168.149.137", 8001),
+            "Slave 2": ("192.168.149.137", 8002)
             # For multi-laptop: update with colleague IPs
         }
+        self.node_display = {node: f"{host}:{port}" for node, (host, port) in self.node_configs.items()}
+        self.node_ip_port.set(self.node_display[self.node_type.get()])
+
+        # JSON codec for the send path: orjson when available, else one reused compact encoder
+        if orjson is not None:
+            self._encode = orjson.dumps
+        else:
+            encode = json.JSONEncoder(separators=(",", ":")).encode
+            self._encode = lambda obj: encode(obj).encode()
+        self._decode = _json_loads
 
         # Status indicators for node connectivity
         self.status_labels = {}
-        self.status_colors = {}
+        self._last_state = {}  # Node name -> last displayed "up"/"down"; empty until first probe
 
         # Configure Tkinter styles
         style = ttk.Style()
         style.theme_use("clam")
-        style.configure("TButton", padding=8, relief="flat", background="#2196F3", foreground="white", font=("Arial", 10, "bold"))
-        style.map("TButton", background=[("active", "#1976D2")])
-        style.configure("TLabel", background="#2E2E2E", foreground="#FFFFFF", font=("Arial", 11))
-        style.configure("TEntry", padding=6, fieldbackground="#424242", foreground="#FFFFFF")
-        style.configure("TCombobox", padding=6, fieldbackground="#424242", foreground="#FFFFFF")
-        style.configure("TRadiobutton", background="#2E2E2E", foreground="#FFFFFF", font=("Arial", 10))
+        style.configure("TButton", padding=8, relief="flat", background=ACCENT, foreground="white", font=self._fonts["btn"])
+        style.map("TButton", background=[("active", ACCENT_ACTIVE)])
+        style.configure("TLabel", background=BG_DARK, foreground=FG_TEXT, font=self._fonts["label"])
+        style.configure("TEntry", padding=6, fieldbackground=BG_FIELD, foreground=FG_TEXT)
+        style.configure("TCombobox", padding=6, fieldbackground=BG_FIELD, foreground=FG_TEXT)
+        style.configure("TRadiobutton", background=BG_DARK, foreground=FG_TEXT, font=self._fonts["small"])
 
         # Header
-        header = tk.Label(root, text="Distributed Database System", bg="#2E2E2E", fg="#2196F3", font=("Arial", 16, "bold"))
+        header = tk.Label(root, text="Distributed Database System", bg=BG_DARK, fg=ACCENT, font=self._fonts["header"])
         header.pack(pady=10)
 
         # Status panel for node connectivity
-        status_frame = tk.Frame(root, bg="#2E2E2E")
+        status_frame = tk.Frame(root, bg=BG_DARK)
         status_frame.pack(pady=5, fill="x", padx=20)
         for node in self.node_configs:
-            tk.Label(status_frame, text=f"{node}:", bg="#2E2E2E", fg="#FFFFFF", font=("Arial", 10)).pack(side="left", padx=5)
-            status_label = tk.Label(status_frame, text="Checking...", bg="#2E2E2E", fg="#FF9800", font=("Arial", 10))
+            tk.Label(status_frame, text=f"{node}:", bg=BG_DARK, fg=FG_TEXT, font=self._fonts["small"]).pack(side="left", padx=5)
+            status_label = tk.Label(status_frame, text="Checking...", bg=BG_DARK, fg=COLOR_PENDING, font=self._fonts["small"])
             status_label.pack(side="left", padx=5)
             self.status_labels[node] = status_label
-            self.status_colors[node] = "#FF9800"
 
         # Node selection dropdown
-        node_frame = tk.Frame(root, bg="#2E2E2E")
+        node_frame = tk.Frame(root, bg=BG_DARK)
         node_frame.pack(pady=10, fill="x", padx=20)
-        tk.Label(node_frame, text="Node Type:", bg="#2E2E2E", fg="#FFFFFF").pack(side="left")
-        node_combo = ttk.Combobox(node_frame, textvariable=self.node_type, values=["Master", "Slave 1", "Slave 2"], state="readonly")
+        tk.Label(node_frame, text="Node Type:", bg=BG_DARK, fg=FG_TEXT).pack(side="left")
+        node_combo = ttk.Combobox(node_frame, textvariable=self.node_type, values=list(self.node_configs), state="readonly")
         node_combo.pack(side="left", padx=5)
         node_combo.bind("<<ComboboxSelected>>", self.update_node_ip)
-        tk.Label(node_frame, text="IP:Port:", bg="#2E2E2E", fg="#FFFFFF").pack(side="left", padx=5)
+        tk.Label(node_frame, text="IP:Port:", bg=BG_DARK, fg=FG_TEXT).pack(side="left", padx=5)
         ttk.Entry(node_frame, textvariable=self.node_ip_port, width=20, state="readonly").pack(side="left", padx=5)
 
         # Operation selection radio buttons
-        op_frame = tk.Frame(root, bg="#2E2E2E")
+        op_frame = tk.Frame(root, bg=BG_DARK)
         op_frame.pack(pady=10, fill="x", padx=20)
-        tk.Label(op_frame, text="Operation:", bg="#2E2E2E", fg="#FFFFFF").pack(anchor="w")
-        operations = ["CREATE_DB", "CREATE_TABLE", "INSERT", "UPDATE", "DELETE", "SEARCH"]
-        if self.node_type.get() == "Master":
-            operations.append("DROP_DB")
+        tk.Label(op_frame, text="Operation:", bg=BG_DARK, fg=FG_TEXT).pack(anchor="w")
+        # Radio buttons are built once; only DROP_DB is shown/hidden per node type
+        operations = ["CREATE_DB", "CREATE_TABLE", "INSERT", "UPDATE", "DELETE", "SEARCH", "DROP_DB"]
+        self._op_radios = {}
         for op in operations:
-            ttk.Radiobutton(op_frame, text=op.replace("_", " "), value=op, variable=self.operation, command=self.update_fields).pack(anchor="w")
+            radio = ttk.Radiobutton(op_frame, text=op.replace("_", " "), value=op, variable=self.operation, command=self.update_fields)
+            radio.pack(anchor="w")
+            self._op_radios[op] = radio
 
         # Input fields frame
-        self.input_frame = tk.Frame(root, bg="#2E2E2E")
+        self.input_frame = tk.Frame(root, bg=BG_DARK)
         self.input_frame.pack(pady=10, fill="x", padx=20)
 
         # Input fields with tooltips
-        self.db_label = tk.Label(self.input_frame, text="Database Name:", bg="#2E2E2E", fg="#FFFFFF")
+        self.db_label = tk.Label(self.input_frame, text="Database Name:", bg=BG_DARK, fg=FG_TEXT)
         self.db_entry = ttk.Entry(self.input_frame, textvariable=self.database)
-        ToolTip(self.db_entry, "Name of the database, e.g., 'mydb'")
-        self.table_label = tk.Label(self.input_frame, text="Table Name:", bg="#2E2E2E", fg="#FFFFFF")
+        self.table_label = tk.Label(self.input_frame, text="Table Name:", bg=BG_DARK, fg=FG_TEXT)
         self.table_entry = ttk.Entry(self.input_frame, textvariable=self.table)
-        ToolTip(self.table_entry, "Name of the table, e.g., 'users'")
-        self.data_label = tk.Label(self.input_frame, text="Data (JSON):", bg="#2E2E2E", fg="#FFFFFF")
+        self.data_label = tk.Label(self.input_frame, text="Data (JSON):", bg=BG_DARK, fg=FG_TEXT)
         self.data_entry = ttk.Entry(self.input_frame, textvariable=self.data)
-        self.cond_label = tk.Label(self.input_frame, text="Condition (JSON):", bg="#2E2E2E", fg="#FFFFFF")
+        self.cond_label = tk.Label(self.input_frame, text="Condition (JSON):", bg=BG_DARK, fg=FG_TEXT)
         self.cond_entry = ttk.Entry(self.input_frame, textvariable=self.condition)
 
+        # Field dispatch table: name -> (label, entry, tooltip). Each entry gets
+        # exactly one tooltip whose text update_fields swaps per operation.
+        self._fields = {
+            name: (label, entry, ToolTip(entry, "", font=self._fonts["small"]))
+            for name, label, entry in [
+                ("db", self.db_label, self.db_entry),
+                ("table", self.table_label, self.table_entry),
+                ("data", self.data_label, self.data_entry),
+                ("cond", self.cond_label, self.cond_entry),
+            ]
+        }
+
         # Initialize fields
         self.update_fields()
 
         # Execute button
-        ttk.Button(root, text="Execute", command=self.execute).pack(pady=20)
+        self._exec_btn = ttk.Button(root, text="Execute", command=self.execute)
+        self._exec_btn.pack(pady=20)
+        # One long-lived daemon worker runs queued operations, so sends never overlap
+        # and an in-flight operation cannot hold the process open after the window closes
+        self._exec_queue = queue.Queue()
+        threading.Thread(target=self._exec_worker, name="ddb-exec", daemon=True).start()
 
         # Status label for operation feedback
-        self.status = tk.Label(root, text="", bg="#2E2E2E", fg="#4CAF50", font=("Arial", 10))
+        self.status = tk.Label(root, text="", bg=BG_DARK, fg=COLOR_OK, font=self._fonts["small"])
         self.status.pack()
 
         # Result display
-        self.result = tk.Text(root, height=12, width=80, bg="#424242", fg="#FFFFFF", insertbackground="white")
+        self.result = tk.Text(root, height=12, width=80, bg=BG_FIELD, fg=FG_TEXT, insertbackground="white")
         self.result.pack(pady=10, padx=20)
 
         # Start node status checker
-        self.running = True
+        self._stable_rounds = 0  # Consecutive rounds with all nodes up and no changes
+        self._probe_sockets = {}  # Node name -> connected probe socket
         threading.Thread(target=self.check_node_status, daemon=True).start()
 
-    def check_node_status(self):
-        # Periodically check node connectivity
-        while self.running:
-            for node, addr in self.node_configs.items():
-                host, port = addr.split(":")
+    def _start_probe_connect(self, host, port):
+        # Begin a non-blocking keepalive connect; the selector reports its outcome
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # Each tuning knob is platform-specific (macOS names the idle time TCP_KEEPALIVE)
+            for name, value in (("TCP_KEEPIDLE", 5), ("TCP_KEEPALIVE", 5),
+                                ("TCP_KEEPINTVL", 2), ("TCP_KEEPCNT", 2)):
+                if hasattr(socket, name):
+                    try:
+                        s.setsockopt(socket.IPPROTO_TCP, getattr(socket, name), value)
+                    except OSError:
+                        pass  # Defined but unsupported by this OS build; keep the default
+            s.setblocking(False)
+            err = s.connect_ex((host, port))
+            if err not in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+                raise OSError(err, "connect failed")
+        except OSError:
+            s.close()
+            raise
+        return s
+
+    def _cached_probe_alive(self, node):
+        # Check the node's cached socket, dropping it if the peer has gone away
+        s = self._probe_sockets.get(node)
+        if s is None:
+            return False
+        try:
+            if s.recv(1, socket.MSG_PEEK):
+                return True
+            # Empty read: peer closed the connection
+        except BlockingIOError:
+            return True  # Nothing to read, connection still open
+        except OSError:
+            pass
+        s.close()
+        del self._probe_sockets[node]
+        return False
+
+    def _probe_nodes(self, timeout=2):
+        # Probe all nodes from this thread: cached sockets are peeked, the rest
+        # reconnect together and are awaited on a single selector
+        results = {}
+        with selectors.DefaultSelector() as sel:
+            for node, (host, port) in self.node_configs.items():
+                if self._cached_probe_alive(node):
+                    results[node] = True
+                    continue
                 try:
-                    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                        s.settimeout(2)
-                        s.connect((host, int(port)))
-                        self.status_colors[node] = "#4CAF50"  # Green
-                        self.root.after(0, lambda n=node: self.status_labels[n].config(text="Connected", fg="#4CAF50"))
-                except:
-                    self.status_colors[node] = "#F44336"  # Red
-                    self.root.after(0, lambda n=node: self.status_labels[n].config(text="Disconnected", fg="#F44336"))
-            time.sleep(5)
+                    s = self._start_probe_connect(host, port)
+                except OSError:
+                    results[node] = False
+                    continue
+                sel.register(s, selectors.EVENT_READ | selectors.EVENT_WRITE, node)
+
+            deadline = time.monotonic() + timeout
+            while sel.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in sel.select(timeout=remaining):
+                    sel.unregister(key.fileobj)
+                    s, node = key.fileobj, key.data
+                    if s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        self._probe_sockets[node] = s
+                        results[node] = True
+                    else:
+                        s.close()
+                        results[node] = False
+
+            # Connects still pending past the deadline count as unreachable
+            for key in list(sel.get_map().values()):
+                sel.unregister(key.fileobj)
+                key.fileobj.close()
+                results[key.data] = False
+        return results
+
+    def _ui_post(self, fn):
+        # Schedule one batched widget update on the Tk thread; dropped once closing
+        if self._stop.is_set():
+            return
+        try:
+            self.root.after(0, fn)
+        except (RuntimeError, tk.TclError):
+            pass  # Window destroyed between the check and the call
+
+    def _apply_node_statuses(self, statuses):
+        # Apply a whole round of {node: (text, color)} status updates at once
+        for node, (text, color) in statuses.items():
+            self.status_labels[node].config(text=text, fg=color)
+
+    def check_node_status(self):
+        # Periodically check node connectivity, polling less often while all nodes stay up
+        while True:
+            changes = {}
+            for node, ok in self._probe_nodes().items():
+                state = "up" if ok else "down"
+                # Only touch a label when its node changed state
+                if self._last_state.get(node) != state:
+                    self._last_state[node] = state
+                    changes[node] = NODE_STATE_DISPLAY[state]
+            if changes:
+                self._ui_post(lambda st=changes: self._apply_node_statuses(st))
+            if not changes and all(state == "up" for state in self._last_state.values()):
+                self._stable_rounds += 1
+            else:
+                self._stable_rounds = 0
+            interval = min(30, 5 * 2 ** min(self._stable_rounds, 2))  # 5s -> 10s -> 20s
+            if self._stop.wait(interval):
+                break
+        # Only this thread touches the probe sockets, so it closes them on exit
+        for s in self._probe_sockets.values():
+            s.close()
+        self._probe_sockets.clear()
 
     def update_node_ip(self, event=None):
         # Update IP:Port based on node selection
-        self.node_ip_port.set(self.node_configs[self.node_type.get()])
+        self.node_ip_port.set(self.node_display[self.node_type.get()])
+        # DROP_DB is master-only; it is the last radio, so re-packing keeps the order
+        drop_radio = self._op_radios["DROP_DB"]
+        if self.node_type.get() == "Master":
+            drop_radio.pack(anchor="w")
+        else:
+            drop_radio.pack_forget()
+            if self.operation.get() == "DROP_DB":
+                self.operation.set("CREATE_DB")
         self.update_fields()  # Update operations based on node type
 
     def update_fields(self):
         # Dynamically show/hide fields based on operation
-        for widget in [self.db_label, self.db_entry, self.table_label, self.table_entry,
-                      self.data_label, self.data_entry, self.cond_label, self.cond_entry]:
-            widget.pack_forget()
-
-        self.db_entry.delete(0, tk.END)
-        self.table_entry.delete(0, tk.END)
-        self.data_entry.delete(0, tk.END)
-        self.cond_entry.delete(0, tk.END)
-
-        op = self.operation.get()
-        if op == "CREATE_DB":
-            self.db_label.pack(anchor="w")
-            self.db_entry.pack(fill="x", pady=2)
-            self.db_entry.insert(0, "mydb")
-            ToolTip(self.db_entry, "Name of the database to create, e.g., 'mydb'")
-        elif op == "DROP_DB":
-            self.db_label.pack(anchor="w")
-            self.db_entry.pack(fill="x", pady=2)
-            self.db_entry.insert(0, "mydb")
-            ToolTip(self.db_entry, "Name of the database to drop, e.g., 'mydb'")
-        elif op == "CREATE_TABLE":
-            self.db_label.pack(anchor="w")
-            self.db_entry.pack(fill="x", pady=2)
-            self.db_entry.insert(0, "mydb")
-            ToolTip(self.db_entry, "Name of the database, e.g., 'mydb'")
-            self.table_label.pack(anchor="w")
-            self.table_entry.pack(fill="x", pady=2)
-            self.table_entry.insert(0, "users")
-            ToolTip(self.table_entry, "Name of the table to create, e.g., 'users'")
-            self.data_label.pack(anchor="w")
-            self.data_entry.pack(fill="x", pady=2)
-            self.data_entry.insert(0, '{"id": "int", "name": "string"}')
-            ToolTip(self.data_entry, 'Column definitions as JSON, e.g., {"id": "int", "name": "string"}')
-        elif op == "INSERT":
-            self.db_label.pack(anchor="w")
-            self.db_entry.pack(fill="x", pady=2)
-            self.db_entry.insert(0, "mydb")
-            ToolTip(self.db_entry, "Name of the database, e.g., 'mydb'")
-            self.table_label.pack(anchor="w")
-            self.table_entry.pack(fill="x", pady=2)
-            self.table_entry.insert(0, "users")
-            ToolTip(self.table_entry, "Name of the table, e.g., 'users'")
-            self.data_label.pack(anchor="w")
-            self.data_entry.pack(fill="x", pady=2)
-            self.data_entry.insert(0, '{"id": 1, "name": "Alice"}')
-            ToolTip(self.data_entry, 'Row data as JSON, e.g., {"id": 1, "name": "Alice"}')
-        elif op == "UPDATE":
-            self.db_label.pack(anchor="w")
-            self.db_entry.pack(fill="x", pady=2)
-            self.db_entry.insert(0, "mydb")
-            ToolTip(self.db_entry, "Name of the database, e.g., 'mydb'")
-            self.table_label.pack(anchor="w")
-            self.table_entry.pack(fill="x", pady=2)
-            self.table_entry.insert(0, "users")
-            ToolTip(self.table_entry, "Name of the table, e.g., 'users'")
-            self.data_label.pack(anchor="w")
-            self.data_entry.pack(fill="x", pady=2)
-            self.data_entry.insert(0, '{"name": "Alicia"}')
-            ToolTip(self.data_entry, 'Values to update as JSON, e.g., {"name": "Alicia"}')
-            self.cond_label.pack(anchor="w")
-            self.cond_entry.pack(fill="x", pady=2)
-            self.cond_entry.insert(0, '{"id": 1}')
-            ToolTip(self.cond_entry, 'Condition to select rows, e.g., {"id": 1}')
-        elif op == "DELETE":
-            self.db_label.pack(anchor="w")
-            self.db_entry.pack(fill="x", pady=2)
-            self.db_entry.insert(0, "mydb")
-            ToolTip(self.db_entry, "Name of the database, e.g., 'mydb'")
-            self.table_label.pack(anchor="w")
-            self.table_entry.pack(fill="x", pady=2)
-            self.table_entry.insert(0, "users")
-            ToolTip(self.table_entry, "Name of the table, e.g., 'users'")
-            self.cond_label.pack(anchor="w")
-            self.cond_entry.pack(fill="x", pady=2)
-            self.cond_entry.insert(0, '{"id": 1}')
-            ToolTip(self.cond_entry, 'Condition to select rows to delete, e.g., {"id": 1}')
-        elif op == "SEARCH":
-            self.db_label.pack(anchor="w")
-            self.db_entry.pack(fill="x", pady=2)
-            self.db_entry.insert(0, "mydb")
-            ToolTip(self.db_entry, "Name of the database, e.g., 'mydb'")
-            self.table_label.pack(anchor="w")
-            self.table_entry.pack(fill="x", pady=2)
-            self.table_entry.insert(0, "users")
-            ToolTip(self.table_entry, "Name of the table, e.g., 'users'")
-            self.cond_label.pack(anchor="w")
-            self.cond_entry.pack(fill="x", pady=2)
-            self.cond_entry.insert(0, '{"id": 1}')
-            ToolTip(self.cond_entry, 'Filter rows, e.g., {"id": 1} for specific ID, or {} for all rows')
+        for label, entry, _ in self._fields.values():
+            label.pack_forget()
+            entry.pack_forget()
+            # Hidden fields must stay empty so they are not sent with the operation
+            entry.delete(0, tk.END)
+
+        for name, default, tip in FIELD_SPECS.get(self.operation.get(), []):
+            label, entry, tooltip = self._fields[name]
+            label.pack(anchor="w")
+            entry.pack(fill="x", pady=2)
+            entry.insert(0, default)
+            tooltip.text = tip
 
     def execute(self):
-        # Trigger operation execution in a separate thread
-        self.status.config(text="Processing...", fg="#FF9800")
-        threading.Thread(target=self._execute_operation, daemon=True).start()
+        # Trigger operation execution on the worker, disabling Execute until it finishes
+        self.status.config(text="Processing...", fg=COLOR_PENDING)
+        self._exec_btn.config(state="disabled")
+        self._exec_queue.put(self._execute_operation)
+
+    def _exec_worker(self):
+        # Run queued operations one at a time; None is the shutdown sentinel
+        while (job := self._exec_queue.get()) is not None:
+            try:
+                job()
+            except Exception:
+                traceback.print_exc()  # Keep the worker alive for later operations
+            finally:
+                self._ui_post(lambda: self._exec_btn.config(state="normal"))
 
     def _execute_operation(self):
         # Execute operation by sending to selected node
-        addr = self.node_ip_port.get()
+        addr = self.node_configs[self.node_type.get()]
         op = {
             "Type": self.operation.get(),
             "Database": self.database.get(),
@@ -266,46 +433,92 @@ class DatabaseGUI:
             "Condition": {}
         }
         try:
-            data_str = self.data.get() or "{}"
-            op["Data"] = json.loads(data_str)
-            cond_str = self.condition.get() or "{}"
-            op["Condition"] = json.loads(cond_str)
-        except json.JSONDecodeError as e:
-            self.root.after(0, lambda: messagebox.showerror("Error", f"Invalid JSON: {e}"))
-            self.root.after(0, lambda: self.status.config(text="Error: Invalid JSON", fg="#F44336"))
+            # Empty fields stay {} without going through the parser
+            if data_str := self.data.get().strip():
+                op["Data"] = _parse_json(data_str)
+            if cond_str := self.condition.get().strip():
+                op["Condition"] = _parse_json(cond_str)
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
+            reason = str(e)  # e is unbound once the except block exits
+            self._ui_post(lambda: (self.status.config(text="Error: Invalid JSON", fg=COLOR_ERROR),
+                                   messagebox.showerror("Error", f"Invalid JSON: {reason}")))
             return
 
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                host, port = addr.split(":")
-                s.settimeout(10)
-                s.connect((host, int(port)))
-                s.sendall(json.dumps(op).encode())
-                data = s.recv(4096).decode()
-                self.root.after(0, lambda: self.result.delete(1.0, tk.END))
-                if op["Type"] == "SEARCH":
-                    try:
-                        results = json.loads(data)
-                        self.root.after(0, lambda: self.result.insert(tk.END, json.dumps(results, indent=2)))
-                        self.root.after(0, lambda: self.status.config(text="SEARCH completed", fg="#4CAF50"))
-                    except json.JSONDecodeError:
-                        self.root.after(0, lambda: self.result.insert(tk.END, data))
-                        self.root.after(0, lambda: self.status.config(text="Error: Invalid SEARCH response", fg="#F44336"))
+            with self._open(*addr, timeout=10) as s:
+                request = self._encode(op)
+                s.sendall(FRAME_HEADER.pack(STATUS_OK, len(request)) + request)
+                status, n = FRAME_HEADER.unpack(self._recv_exact(s, FRAME_HEADER.size))
+                if n > MAX_FRAME_SIZE:
+                    raise ConnectionError(f"Response frame of {n} bytes exceeds limit of {MAX_FRAME_SIZE}")
+                body = self._recv_exact(s, n)
+                if status != STATUS_OK:
+                    payload = body.decode()
+                    msg, color = "Operation failed", COLOR_ERROR
+                elif op["Type"] == "SEARCH":
+                    # A successful SEARCH body is always the node's JSON-encoded rows
+                    payload = json.dumps(self._decode(body), indent=2)
+                    msg, color = "SEARCH completed", COLOR_OK
                 else:
-                    self.root.after(0, lambda: self.result.insert(tk.END, data))
-                    if data.startswith("Error"):
-                        self.root.after(0, lambda: self.status.config(text="Operation failed", fg="#F44336"))
-                    else:
-                        self.root.after(0, lambda: self.status.config(text=f"Operation {op['Type']} completed", fg="#4CAF50"))
+                    payload = body.decode()
+                    msg, color = f"Operation {op['Type']} completed", COLOR_OK
+                payload = self._cap_lines(payload)
+                self._ui_post(lambda: self._show_result(payload, msg, color))
         except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to execute operation: {e}"))
-            self.root.after(0, lambda: self.status.config(text=f"Error: {e}", fg="#F44336"))
-            self.root.after(0, lambda: self.result.delete(1.0, tk.END))
-            self.root.after(0, lambda: self.result.insert(tk.END, f"Error: {e}"))
+            reason = str(e)  # e is unbound once the except block exits
+            self._ui_post(lambda: (self._show_result(f"Error: {reason}", f"Error: {reason}", COLOR_ERROR),
+                                   messagebox.showerror("Error", f"Failed to execute operation: {reason}")))
+
+    def _open(self, host, port, timeout):
+        # Connect an operation socket. The timeout is set before connect() (never via
+        # setblocking) so Windows avoids CPython's slow timed-connect fallback.
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            # Send small ops immediately and size buffers for large SEARCH replies;
+            # set before connect so the receive window is negotiated at handshake
+            s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 262144)
+            s.settimeout(timeout)
+            s.connect((host, port))
+        except OSError:
+            s.close()
+            raise
+        return s
+
+    def _recv_exact(self, s, n):
+        # Read exactly n bytes into a preallocated buffer
+        buf = bytearray(n)
+        view = memoryview(buf)
+        off = 0
+        while off < n:
+            got = s.recv_into(view[off:], n - off)
+            if not got:
+                raise ConnectionError("Connection closed before full response was received")
+            off += got
+        return buf
+
+    def _cap_lines(self, text):
+        # Limit text to RESULT_MAX_LINES so the Text widget never lays out huge replies
+        # A trailing newline ends the last line rather than starting another
+        body = text[:-1] if text.endswith("\n") else text
+        lines = body.split("\n", RESULT_MAX_LINES)
+        if len(lines) <= RESULT_MAX_LINES:
+            return text
+        hidden = lines.pop().count("\n") + 1
+        lines.append(f"... ({hidden} more lines not shown)")
+        return "\n".join(lines)
+
+    def _show_result(self, payload, msg, color):
+        # Replace the result text with one bulk insert and update the status line
+        self.result.delete("1.0", tk.END)
+        self.result.insert("1.0", payload)
+        self.status.config(text=msg, fg=color)
 
     def cleanup(self):
-        # Stop status checker on window close
-        self.running = False
+        # Stop status checker and operation worker on window close
+        self._stop.set()
+        self._exec_queue.put(None)
 
 if __name__ == "__main__":
     root = tk.Tk()
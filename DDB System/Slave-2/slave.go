@@ -1,13 +1,15 @@
 package main
 
 import (
-	"database/sql"  // SQL Server database operations
-	"encoding/json" // JSON encoding/decoding for TCP
-	"fmt"           // Formatting and error handling
-	"log"           // Logging for debugging
-	"net"           // TCP server for client connections
-	"os"            // Command-line arguments for port
-	"strings"       // String manipulation for SQL
+	"database/sql"    // SQL Server database operations
+	"encoding/binary" // Length prefix for framed TCP messages
+	"encoding/json"   // JSON encoding/decoding for TCP
+	"fmt"             // Formatting and error handling
+	"io"              // Reading exact-length frames
+	"log"             // Logging for debugging
+	"net"             // TCP server for client connections
+	"os"              // Command-line arguments for port
+	"strings"         // String manipulation for SQL
 
 	_ "github.com/denisenkom/go-mssqldb" // SQL Server driver
 )
@@ -75,11 +77,14 @@ func (s *Slave) acceptConnections() {
 // handleUpdate processes client operations
 func (s *Slave) handleUpdate(conn net.Conn) {
 	defer conn.Close()
-	decoder := json.NewDecoder(conn)
 	var op Operation
-	if err := decoder.Decode(&op); err != nil {
+	frame, err := readFrame(conn)
+	if err == nil {
+		err = json.Unmarshal(frame, &op)
+	}
+	if err != nil {
 		log.Printf("Failed to decode operation: %v", err)
-		conn.Write([]byte(fmt.Sprintf("Error: Failed to decode operation: %v", err)))
+		writeFrame(conn, statusError, []byte(fmt.Sprintf("Error: Failed to decode operation: %v", err)))
 		return
 	}
 	log.Printf("Received operation: %s, Database: %s, Table: %s, Data: %v, Condition: %v",
@@ -87,24 +92,24 @@ func (s *Slave) handleUpdate(conn net.Conn) {
 	results, err := s.processOperation(op)
 	if err != nil {
 		log.Printf("Operation %s failed: %v", op.Type, err)
-		conn.Write([]byte(fmt.Sprintf("Error: %v", err)))
+		writeFrame(conn, statusError, []byte(fmt.Sprintf("Error: %v", err)))
 		return
 	}
 	if op.Type == "SEARCH" {
 		data, err := json.Marshal(results)
 		if err != nil {
 			log.Printf("Failed to marshal SEARCH result: %v", err)
-			conn.Write([]byte(fmt.Sprintf("Error: Failed to marshal SEARCH result: %v", err)))
+			writeFrame(conn, statusError, []byte(fmt.Sprintf("Error: Failed to marshal SEARCH result: %v", err)))
 			return
 		}
-		_, err = conn.Write(data)
+		err = writeFrame(conn, statusOK, data)
 		if err != nil {
 			log.Printf("Failed to send SEARCH result: %v", err)
 		} else {
 			log.Printf("Sent SEARCH result with %d records", len(results))
 		}
 	} else {
-		conn.Write([]byte("Operation completed successfully"))
+		writeFrame(conn, statusOK, []byte("Operation completed successfully"))
 	}
 	log.Printf("Processed operation: %s successfully", op.Type)
 }
@@ -318,6 +323,41 @@ func (s *Slave) getTableColumns(dbName, tableName string) ([]string, error) {
 	return columns, nil
 }
 
+// Frame header: 1-byte status followed by a 4-byte big-endian payload length
+const (
+	frameHeaderSize = 5
+	statusOK        = 0        // Payload is a successful result
+	statusError     = 1        // Payload is an error message
+	maxFrameSize    = 64 << 20 // Bounds a message so a corrupt header cannot force a huge allocation
+)
+
+// readFrame reads one framed message and returns its payload (requests always carry statusOK)
+func readFrame(conn net.Conn) ([]byte, error) {
+	var header [frameHeaderSize]byte
+	if _, err := io.ReadFull(conn, header[:]); err != nil {
+		return nil, err
+	}
+	n := binary.BigEndian.Uint32(header[1:])
+	if n > maxFrameSize {
+		return nil, fmt.Errorf("frame of %d bytes exceeds limit of %d", n, maxFrameSize)
+	}
+	payload := make([]byte, n)
+	if _, err := io.ReadFull(conn, payload); err != nil {
+		return nil, err
+	}
+	return payload, nil
+}
+
+// writeFrame sends data as one framed message with the given status
+func writeFrame(conn net.Conn, status byte, data []byte) error {
+	frame := make([]byte, frameHeaderSize+len(data))
+	frame[0] = status
+	binary.BigEndian.PutUint32(frame[1:], uint32(len(data)))
+	copy(frame[frameHeaderSize:], data)
+	_, err := conn.Write(frame)
+	return err
+}
+
 // sortedKeys returns sorted map keys
 func sortedKeys(m map[string]interface{}) []string {
 	keys := make([]string, 0, len(m))